@@ -272,14 +272,19 @@ def MODEL():
 
             coord_str = ''
 
-            def func_near(i):  # i = file#, fi = slice#
+            def func_near(i, fi):  # i = file#, fi = slice#
                 pattern_files = self.pattern_files[pattern_key]
 
                 # Kamodo RU.create_timelist discards file path for no reason
                 # pattern_files = [os.path.join(file_dir, 'Output', file) for file in pattern_files]
 
                 with RU.Dataset(self.pattern_files[pattern_key][i]) as cdf_data:
-                    data = array(cdf_data.variables[gvar])
+                    cdf_var = cdf_data.variables[gvar]
+                    # Files converted before time became a dimension store a single time step without it
+                    if 'time' in cdf_var.dimensions:
+                        data = array(cdf_var[fi])
+                    else:
+                        data = array(cdf_var)
 
                 # Using nearest interpolator
                 def nearest_xvec(xvec):
@@ -306,7 +311,7 @@ def MODEL():
             # functionalize the 3D or 4D dataset, series of time slices
             self = RU.Functionalize_Dataset(
                 self, coord_dict, varname, self.variables[varname],
-                gridded_int, coord_str, interp_flag=1, func=func_near,
+                gridded_int, coord_str, interp_flag=3, func=func_near,
                 times_dict=self.times[pattern_key], func_default='custom')
             return
 
@@ -552,7 +557,8 @@ def MODEL():
             if self._force_convert_all or not RU._isfile(list_file) or not RU._isfile(time_file):
                 from kamodo_ccmc.readers.verb3d_tocdf import convert_all
                 # TODO: Do we need self.conversion_test?
-                self.conversion_test = convert_all(file_dir, start_date=self._start_date)
+                self.conversion_test = convert_all(file_dir, start_date=self._start_date,
+                                                   force=self._force_convert_all)
             return time_file, list_file
 
         def _nearest_xvec_data_LEA(self, xvec, data):
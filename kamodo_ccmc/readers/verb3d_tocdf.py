@@ -10,13 +10,47 @@ import kamodo_ccmc.readers.reader_utilities as RU
 from datetime import datetime
 import re
 import json
+import functools
 import rbamlib
 
+# Regular expressions are compiled once at import
+# Date and time of the simulation start in `DatabaseInfo1`
+_START_TIME_RE = re.compile(r'(\d{4}/\d{2}/\d{2} \d{2}:\d{2})\s+# start_time')
+# Quoted variable names in the Variables header line
+_QUOTED_RE = re.compile(r'"([^"]*)"')
+
+
+def _file_stamp(filename):
+    '''
+    Returns the modification time and size of a local file, or None if the file cannot be stat'ed.
+    '''
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _start_date_files(file_dir):
+    '''
+    Returns the files that `get_start_date` reads: `DatabaseInfo1` and the possible `ror_metadata.json` paths.
+    '''
+    database_filename = os.path.join(file_dir, '..', 'DatabaseInfo1')
+    metadata_paths = [
+        os.path.join(file_dir, 'ror_metadata.json'),
+        os.path.join(file_dir, '..', 'ror_metadata.json')
+    ]
+    return database_filename, metadata_paths
+
 
 def get_start_date(file_dir):
     '''
     Returns the start date based on the information available in `DatabaseInfo1` or `ror_metadata.json`.
 
+    The result is cached per `file_dir` and is re-read when the modification time or size of any of the files it
+    depends on changes. A rewrite that keeps the file size and lands within the same file system timestamp tick is
+    not detected, call `get_start_date.cache_clear()` to drop the cache in that case.
+
     Inputs:
         file_dir (str): Directory where the model output data is located.
 
@@ -24,29 +58,34 @@ def get_start_date(file_dir):
         datetime: The simulation start date extracted from either `DatabaseInfo1` or `ror_metadata.json`.
                   Defaults to `1970-01-01` if not found.
     '''
+    database_filename, metadata_paths = _start_date_files(file_dir)
+    stamps = tuple(_file_stamp(filename) for filename in [database_filename, *metadata_paths])
+    return _get_start_date(file_dir, stamps)
+
+
+@functools.lru_cache(maxsize=32)
+def _get_start_date(file_dir, stamps):
+    '''
+    Cached implementation of `get_start_date`. `stamps` is only used as part of the cache key.
+    '''
 
     # Default date_start
     date_start = datetime(1970, 1, 1)
 
+    # Possible files with the start date, the same files are used for the cache key in `get_start_date`
+    database_filename, metadata_paths = _start_date_files(file_dir)
+
     # Determine if there is a file that contains userinput
-    database_filename = os.path.join(file_dir, '..', 'DatabaseInfo1')
     if RU._isfile(database_filename):
 
-        # Define the regex pattern for the date and time
-        pattern = r'(\d{4}/\d{2}/\d{2} \d{2}:\d{2})\s+# start_time'
-
         with open(database_filename, 'r') as file:
             for line in file:
-                match = re.search(pattern, line)
+                match = _START_TIME_RE.search(line)
                 if match:
                     date_str = match.group(1)  # Return only the date part
                     date_start = datetime.strptime(date_str, '%Y/%m/%d %H:%M')
-
-    # Define possible metadata file paths
-    metadata_paths = [
-        os.path.join(file_dir, 'ror_metadata.json'),
-        os.path.join(file_dir, '..', 'ror_metadata.json')
-    ]
+                    # Stop at the first start_time, the rest of the file is not needed
+                    break
 
     # Check if the metadata file exists in any of the defined paths
     metadata_filename = next((path for path in metadata_paths if RU._isfile(path)), None)
@@ -67,39 +106,199 @@ def get_start_date(file_dir):
     return date_start
 
 
-def convert_all(file_dir, start_date=None):
-    '''
-    Converts all model output `plt` files in the directory into NetCDF4 format for use in Kamodo.
+get_start_date.cache_clear = _get_start_date.cache_clear
 
-    This includes:
-    - perp_grid.plt: Model grid data, including `pc`.
-    - OutPSD.dat: Phase space density (PSD) data.
-    - out1d.dat: 1D output data.
 
-    Additional variables such as Mu and K are calculated from the grid data and added to the NetCDF files.
+def _read_out1d(out1d_filename):
+    '''
+    Reads the 1D output file `out1d.dat` into a pandas DataFrame.
+
+    pyarrow's multithreaded CSV reader is used when it is installed and the columns are separated by a single
+    tab or space. Otherwise, or if pyarrow fails to parse the file, the data is parsed by the pandas C parser.
 
     Inputs:
-        file_dir (str): Directory where the model output data is located.
-        start_date (datetime, optional): Simulation start date. If not provided, it will be retrieved from the metadata files.
+        out1d_filename (str): Path to the `out1d.dat` file.
 
     Returns:
-        bool: True if the conversion is successful, False otherwise.
+        tuple: The list of variable names and the DataFrame with one column per variable.
     '''
+    import pandas as pd
 
-    # perp_grid_filename = os.path.join(file_dir, 'Output', 'perp_grid.plt')
-    # psd_filename = os.path.join(file_dir, 'Output', 'OutPSD.dat')
-    perp_grid_filename = os.path.join(file_dir, 'perp_grid.plt')
-    psd_filename = os.path.join(file_dir, 'OutPSD.dat')
-    out1d_filename = os.path.join(file_dir, 'out1d.dat')
+    with open(out1d_filename, 'r') as file:
+        # The header is two lines, the Variables line followed by the ZONE line
+        header_lines = 2
+        for _ in range(header_lines):
+            line = file.readline().strip()
 
-    # check for files existence
-    if not RU._isfile(perp_grid_filename) or not RU._isfile(psd_filename) or not RU._isfile(out1d_filename):
+            # Capture the variables in the line that contains VARIABLES
+            if line.startswith("Variables"):
+                # Extract the variables from the line
+                variables_str = line.split('=')[1].strip()
+                variables = _QUOTED_RE.findall(variables_str)
+
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pac
+        except ImportError:
+            pac = None
+
+        if pac is not None:
+            # pyarrow only supports a single character delimiter, check that it splits the first row correctly
+            data_start = file.tell()
+            first_line = file.readline().rstrip('\r\n')
+            file.seek(data_start)
+            delimiter = '\t' if '\t' in first_line else ' '
+            if len(first_line.split(delimiter)) == len(variables):
+                try:
+                    table = pac.read_csv(out1d_filename,
+                                         read_options=pac.ReadOptions(skip_rows=header_lines, column_names=variables),
+                                         parse_options=pac.ParseOptions(delimiter=delimiter))
+                    return variables, table.to_pandas()
+                except pa.ArrowInvalid:
+                    # A later row is not separated by a single delimiter, fall back to the whitespace parser
+                    file.seek(data_start)
+
+        # The file is positioned right after the header, so the data is parsed without reading the file again.
+        # Columns are not named here, so that extra data columns are not silently turned into the index.
+        df = pd.read_csv(file, sep=r'\s+', header=None, index_col=False, engine='c')
+
+    if df.shape[1] != len(variables):
+        raise ValueError(f'{out1d_filename} has {df.shape[1]} data columns, but {len(variables)} variables in the header')
+    df.columns = variables
+
+    return variables, df
+
+
+def _load_plt_iter(filename):
+    '''
+    Reads a single variable plt file, like `OutPSD.dat`, one zone at a time.
+
+    Unlike pyverbplt.load_plt, which returns all zones in a single array, only the current zone is kept in memory
+    and the file is read in a single pass.
+
+    Inputs:
+        filename (str): Path to the plt file.
+
+    Yields:
+        tuple: The zone title (str) and the zone data as a float32 array of shape (K, J, I).
+    '''
+    with open(filename, 'r') as file:
+        while True:
+            line = file.readline()
+            if not line:
+                break
+
+            # Skip the header lines until the next zone
+            if 'ZONE' not in line:
+                continue
+
+            zone_info = line.replace(',', '').split()
+            title = zone_info[1].split('=')[1].replace('"', '')
+            dimensions = [int(d.split('=')[1]) for d in zone_info[2:]]
+
+            lines = [file.readline() for _ in range(int(np.prod(dimensions)))]
+            yield title, np.loadtxt(lines, dtype=np.float32).reshape(dimensions[::-1])
+
+
+def _all_fresh(srcs, dsts):
+    '''
+    Checks whether the converted files are up to date with respect to the model output files.
+
+    Inputs:
+        srcs (list of str): Model output files that are read by the conversion.
+        dsts (list of str): NetCDF files that are written by the conversion.
+
+    Returns:
+        bool: True if all `dsts` files exist and are newer than every file in `srcs`, False otherwise.
+    '''
+    if not all(os.path.isfile(dst) for dst in dsts):
         return False
 
-    # Get the start date
-    if not start_date:
-        start_date = get_start_date(file_dir)
+    newest_src = max(os.path.getmtime(src) for src in srcs)
+    return all(os.path.getmtime(dst) > newest_src for dst in dsts)
+
+
+def _out1d_dtype_matches(out1d_cdf_filename, out1d_dtype):
+    '''
+    Checks whether the variables of an existing `out1d.nc` are stored with the requested data type.
+
+    Inputs:
+        out1d_cdf_filename (str): Path to the `out1d.nc` file.
+        out1d_dtype (numpy dtype): Requested data type of the `out1d.nc` variables.
+
+    Returns:
+        bool: True if all variables in the file have the data type `out1d_dtype`, False otherwise.
+    '''
+    with Dataset(out1d_cdf_filename, 'r') as ncfile:
+        return all(var.dtype == np.dtype(out1d_dtype) for var in ncfile.variables.values())
+
+
+def _read_complete_time(cdf_filename, var_name):
+    '''
+    Reads the time coordinate of an existing PSD file, if the file is complete.
+
+    Inputs:
+        cdf_filename (str): Path to the NetCDF file with a `time` coordinate.
+        var_name (str): Name of the time dependent variable that must have a time for every step.
+
+    Returns:
+        numpy.ndarray or None: The time coordinate, or None if the time is missing for any step of `var_name`.
+    '''
+    with Dataset(cdf_filename, 'r') as ncfile:
+        time = ncfile.variables['time'][:]
+        if len(time) != ncfile.variables[var_name].shape[0] or np.ma.count_masked(time) > 0:
+            return None
+    return np.asarray(time, dtype=np.float32)
+
+
+def _create_timelist(file_dir, time, pattern_files, start_date):
+    '''
+    Creates the time and list files used by the Kamodo reader.
+
+    Inputs:
+        file_dir (str): Directory where the model output data is located.
+        time (numpy.ndarray): Time steps of the PSD output in days since the start of the simulation.
+        pattern_files (dict): Converted NetCDF file names for each file pattern.
+        start_date (datetime): Simulation start date.
+    '''
+    modelname = 'VERB-3D'
+    # List of files for Kamodo reader
+    list_file = file_dir + modelname + '_list.txt'
+    time_file = file_dir + modelname + '_times.txt'
+
+    times_list = time * 24  # Convert to number of hours
+
+    # All times are stored as the number of hours since midnight of the
+    # first file of all the files in the given directory.
+    # Each PSD file holds every time step, so it starts at the first and ends at the last one.
+    times = {'OutPSD_Flux': {'start': [times_list[0]], 'end': [times_list[-1]], 'all': times_list},
+             'OutPSD_lmk': {'start': [times_list[0]], 'end': [times_list[-1]], 'all': times_list},
+             'perp_grid': {'start': [times_list[0]], 'end': [times_list[-1]], 'all': [times_list[0]]},
+             'out1d': {'start': [times_list[0]], 'end': [times_list[-1]], 'all': times_list}}
+
+    RU.create_timelist(list_file, time_file, modelname,
+                       times, pattern_files,
+                       start_date)
+
+
+def _write_cdf_files(perp_grid_filename, psd_filename, out1d_filename,
+                     grid_cdf_filename, psd_cdf_filename, psdlmk_cdf_filename, out1d_cdf_filename, out1d_dtype):
+    '''
+    Converts the model output files into the NetCDF files used by Kamodo.
 
+    Inputs:
+        perp_grid_filename (str): Path to the `perp_grid.plt` file.
+        psd_filename (str): Path to the `OutPSD.dat` file.
+        out1d_filename (str): Path to the `out1d.dat` file.
+        grid_cdf_filename (str): Path to the grid NetCDF file.
+        psd_cdf_filename (str): Path to the PSD and flux NetCDF file.
+        psdlmk_cdf_filename (str): Path to the PSD on the (L, Mu, K) grid NetCDF file.
+        out1d_cdf_filename (str): Path to the 1D output NetCDF file.
+        out1d_dtype (numpy dtype): Data type of the variables stored in the 1D output NetCDF file.
+
+    Returns:
+        numpy.ndarray: Time of each PSD step in days from the start of the simulation.
+    '''
     # Work with grid
     grid = pyverbplt.load_plt(perp_grid_filename, squeeze=True)
 
@@ -116,117 +315,164 @@ def convert_all(file_dir, start_date=None):
     data['Mu'] = mu
     data['K'] = K
 
-    # cdf_filename = os.path.join(file_dir, 'Output', 'perp_grid.nc')
-    cdf_filename = os.path.join(file_dir, 'perp_grid.nc')
+    # Cast once to the stored type, so that writing to the file does not convert element by element
+    data = {key: np.ascontiguousarray(var, dtype=np.float32) for key, var in data.items()}
+
     var_shape = grid[0]['arr'].shape
-    grid_file = [cdf_filename]
-    with Dataset(cdf_filename, 'w', format='NETCDF4') as ncfile:
+    # Output files only use classic model features (no groups or user-defined types), which keeps the metadata small.
+    with Dataset(grid_cdf_filename, 'w', format='NETCDF4_CLASSIC') as ncfile:
         # Create dimensions
         ncfile.createDimension('L', var_shape[0])
         ncfile.createDimension('E', var_shape[1])
         ncfile.createDimension('Alpha', var_shape[2])
 
-        for key, var in data.items():
-            data_var = ncfile.createVariable(key, np.float32, ('L', 'E', 'Alpha'))
+        # Define all variables before writing any data, so the file leaves define mode only once
+        grid_vars = [(ncfile.createVariable(key, np.float32, ('L', 'E', 'Alpha'),
+                                            chunksizes=var_shape, zlib=True, shuffle=True, complevel=1), var)
+                     for key, var in data.items()]
+        for data_var, var in grid_vars:
             data_var[:] = var
 
     # Work with PSD, PSD on LMK grid and flux
-    psd = pyverbplt.load_plt(psd_filename)
-
-    time = np.array([np.float32(t) for t in psd['zone']])
-    psd_size = psd['arr'].shape
-
-    nc_psd_files = []
-    nc_psdlmk_files = []
-    reshaped_pc = np.expand_dims(grid[3]['arr'], axis=0)
     units_constant = 1 / 3e7  # (c/MeV/cm)^3 after that
-
-    for t in range(psd_size[0]):
-        # PSD
-        # cdf_filename = os.path.join(file_dir, 'Output', f'OutPSD{t}.nc')
-        cdf_filename = os.path.join(file_dir, f'OutPSD_Flux{t}.nc')
-        nc_psd_files.append(cdf_filename)
-        with Dataset(cdf_filename, 'w', format='NETCDF4') as ncfile:
-            # Create dimensions
-            ncfile.createDimension('time', 1)
-            ncfile.createDimension('L', psd_size[1])
-            ncfile.createDimension('E', psd_size[2])
-            ncfile.createDimension('Alpha', psd_size[3])
-
-            psd_var = ncfile.createVariable('PSD', np.float32, ('L', 'E', 'Alpha'))
-            psd_var[:] = psd['arr'][t, :, :, :] * units_constant
-
-            # Add flux
-            flux_var = ncfile.createVariable('Flux', np.float32, ('L', 'E', 'Alpha'))
-            flux_var[:] = psd['arr'][t, :, :, :] * reshaped_pc ** 2
-
-            # Time is number of days from zero - start of the simulation, directly from zone
-            time_var = ncfile.createVariable('time', np.float32, ('time'))
-            time_var[:] = time[t]
+    pc_sq = (grid[3]['arr'] ** 2).astype(np.float32)
+
+    # One chunk holds a full (L, E, Alpha) field of a single time step, matching how the reader accesses the data.
+    # Shuffle + deflate at the lowest level shrinks float32 fields at a small CPU cost.
+    psd_chunks = (1, var_shape[0], var_shape[1], var_shape[2])
+    compression = dict(zlib=True, shuffle=True, complevel=1)
+
+    # All time steps are written into a single file per pattern, with time as the unlimited dimension.
+    # This avoids defining and closing a pair of files for every time step.
+    with Dataset(psd_cdf_filename, 'w', format='NETCDF4_CLASSIC') as psd_ncfile, \
+            Dataset(psdlmk_cdf_filename, 'w', format='NETCDF4_CLASSIC') as psdlmk_ncfile:
+        # PSD and flux
+        psd_ncfile.createDimension('time', None)
+        psd_ncfile.createDimension('L', var_shape[0])
+        psd_ncfile.createDimension('E', var_shape[1])
+        psd_ncfile.createDimension('Alpha', var_shape[2])
+
+        psd_var = psd_ncfile.createVariable('PSD', np.float32, ('time', 'L', 'E', 'Alpha'),
+                                            chunksizes=psd_chunks, **compression)
+        flux_var = psd_ncfile.createVariable('Flux', np.float32, ('time', 'L', 'E', 'Alpha'),
+                                             chunksizes=psd_chunks, **compression)
+        # Time is number of days from zero - start of the simulation, directly from zone
+        time_var = psd_ncfile.createVariable('time', np.float32, ('time'))
 
         # PSD_LMK
-        cdf_filename = os.path.join(file_dir, f'OutPSD_lmk{t}.nc')
-        nc_psdlmk_files.append(cdf_filename)
-        with Dataset(cdf_filename, 'w', format='NETCDF4') as ncfile:
-            # Create dimensions
-            ncfile.createDimension('time', 1)
-            ncfile.createDimension('L', psd_size[1])
-            ncfile.createDimension('Mu', psd_size[2])
-            ncfile.createDimension('K', psd_size[3])
-
-            psd_var = ncfile.createVariable('PSD_2', np.float32, ('L', 'Mu', 'K'))
-            psd_var[:] = psd['arr'][t, :, :, :] * units_constant
-
-            # Time is number of days from zero - start of the simulation, directly from zone
-            time_var = ncfile.createVariable('time', np.float32, ('time'))
-            time_var[:] = time[t]
+        psdlmk_ncfile.createDimension('time', None)
+        psdlmk_ncfile.createDimension('L', var_shape[0])
+        psdlmk_ncfile.createDimension('Mu', var_shape[1])
+        psdlmk_ncfile.createDimension('K', var_shape[2])
+
+        psdlmk_var = psdlmk_ncfile.createVariable('PSD_2', np.float32, ('time', 'L', 'Mu', 'K'),
+                                                  chunksizes=psd_chunks, **compression)
+        lmk_time_var = psdlmk_ncfile.createVariable('time', np.float32, ('time'))
+
+        # OutPSD.dat is streamed one time step at a time, so the peak memory is a single (L, E, Alpha) field
+        # instead of the full (time, L, E, Alpha) array.
+        # The time of each step is written together with its fields, so an interrupted conversion never leaves
+        # fields without a time.
+        zones = []
+        for t, (zone, psd_arr32) in enumerate(_load_plt_iter(psd_filename)):
+            psd_scaled = psd_arr32 * np.float32(units_constant)
+            psd_var[t] = psd_scaled
+            flux_var[t] = psd_arr32 * pc_sq
+            psdlmk_var[t] = psd_scaled
+            time_var[t] = lmk_time_var[t] = np.float32(zone)
+            zones.append(zone)
+
+        time = np.asarray(zones, dtype=np.float32)
 
     # Load 1d
-    import pandas as pd
-    df = pd.read_csv(out1d_filename, sep='\s+', skiprows=2, header=None)
+    variables, df = _read_out1d(out1d_filename)
 
-    with open(out1d_filename, 'r') as file:
-        for line in file:
-            line = line.strip()
+    # Import 1d variables into the NETCDF4
+    with Dataset(out1d_cdf_filename, 'w', format='NETCDF4_CLASSIC') as ncfile:
+        # Create dimensions, time is unlimited so that later output can be appended without rewriting the file
+        ncfile.createDimension('time', None)
 
-            # Capture the variables in the line that contains VARIABLES
-            if line.startswith("Variables"):
-                # Extract the variables from the line
-                variables_str = line.split('=')[1].strip()
-                variables = re.findall(r'"([^"]*)"', variables_str)
-                break
-    df.columns = variables
+        # Define all variables before writing any data, then write the columns of a single (time, variable) block
+        out1d_vars = [ncfile.createVariable(var_str, out1d_dtype, ('time'),
+                                            chunksizes=(min(df.shape[0], 4096),), **compression)
+                      for var_str in variables]
+        arr = df.to_numpy(dtype=out1d_dtype, copy=False)
+        for i, var in enumerate(out1d_vars):
+            var[:] = arr[:, i]
 
-    # Import 1d variables into the NETCDF4
-    cdf_filename = os.path.join(file_dir, f'out1d.nc')
-    out1d_files = [cdf_filename]
-    with Dataset(cdf_filename, 'w', format='NETCDF4') as ncfile:
-        # Create dimensions
-        ncfile.createDimension('time', df.shape[0])
+    return time
 
-        for var_str in variables:
-            var = ncfile.createVariable(var_str, np.float64, ('time'))
-            var[:] = df[var_str].values
 
-    modelname = 'VERB-3D'
-    # List of files for Kamodo reader
-    list_file = file_dir + modelname + '_list.txt'
-    time_file = file_dir + modelname + '_times.txt'
+def convert_all(file_dir, start_date=None, out1d_dtype=np.float32, force=False):
+    '''
+    Converts all model output `plt` files in the directory into NetCDF4 format for use in Kamodo.
 
-    pattern_files = {'OutPSD_Flux': nc_psd_files, 'OutPSD_lmk': nc_psdlmk_files, 'perp_grid': grid_file,
-                     'out1d': out1d_files}
-    times_list = list(time * 24)  # Convert to number of hours
-    times_end = times_list
+    This includes:
+    - perp_grid.plt: Model grid data, including `pc`.
+    - OutPSD.dat: Phase space density (PSD) data.
+    - out1d.dat: 1D output data.
 
-    # All times are stored as the number of hours since midnight of the
-    # first file of all the files in the given directory.
-    times = {'OutPSD_Flux': {'start': times_list, 'end': times_end, 'all': times_list},
-             'OutPSD_lmk': {'start': times_list, 'end': times_end, 'all': times_list},
-             'perp_grid': {'start': [times_list[0]], 'end': [times_end[-1]], 'all': [times_list[0]]},
-             'out1d': {'start': [times_list[0]], 'end': [times_end[-1]], 'all': times_list}}
+    Additional variables such as Mu and K are calculated from the grid data and added to the NetCDF files.
 
-    RU.create_timelist(list_file, time_file, modelname,
-                       times, pattern_files,
-                       start_date)
+    Inputs:
+        file_dir (str): Directory where the model output data is located.
+        start_date (datetime, optional): Simulation start date. If not provided, it will be retrieved from the metadata files.
+        out1d_dtype (numpy dtype, optional): Data type of the variables stored in `out1d.nc`. Default is np.float32,
+                                             use np.float64 to keep the full precision of the text file.
+        force (bool, optional): If True, the files are converted even if the NetCDF files are newer than the model
+                                output. Default is False. The files are also converted if `out1d.nc` was stored
+                                with a different `out1d_dtype`.
+
+    Returns:
+        bool: True if the conversion is successful, False otherwise.
+    '''
+
+    # perp_grid_filename = os.path.join(file_dir, 'Output', 'perp_grid.plt')
+    # psd_filename = os.path.join(file_dir, 'Output', 'OutPSD.dat')
+    perp_grid_filename = os.path.join(file_dir, 'perp_grid.plt')
+    psd_filename = os.path.join(file_dir, 'OutPSD.dat')
+    out1d_filename = os.path.join(file_dir, 'out1d.dat')
+
+    # check for files existence
+    if not RU._isfile(perp_grid_filename) or not RU._isfile(psd_filename) or not RU._isfile(out1d_filename):
+        return False
+
+    # Get the start date
+    if not start_date:
+        start_date = get_start_date(file_dir)
+
+    # cdf_filename = os.path.join(file_dir, 'Output', 'perp_grid.nc')
+    grid_cdf_filename = os.path.join(file_dir, 'perp_grid.nc')
+    psd_cdf_filename = os.path.join(file_dir, 'OutPSD_Flux.nc')
+    psdlmk_cdf_filename = os.path.join(file_dir, 'OutPSD_lmk.nc')
+    out1d_cdf_filename = os.path.join(file_dir, 'out1d.nc')
+    pattern_files = {'OutPSD_Flux': [psd_cdf_filename], 'OutPSD_lmk': [psdlmk_cdf_filename],
+                     'perp_grid': [grid_cdf_filename], 'out1d': [out1d_cdf_filename]}
+
+    # Skip the conversion if it was already done after the model output was last modified with the same `out1d_dtype`.
+    # Only the time grid is needed to recreate the time and list files.
+    if not force and _all_fresh([perp_grid_filename, psd_filename, out1d_filename],
+                                [grid_cdf_filename, psd_cdf_filename, psdlmk_cdf_filename, out1d_cdf_filename]) \
+            and _out1d_dtype_matches(out1d_cdf_filename, out1d_dtype):
+        time = _read_complete_time(psd_cdf_filename, 'PSD')
+        if time is not None and _read_complete_time(psdlmk_cdf_filename, 'PSD_2') is not None:
+            _create_timelist(file_dir, time, pattern_files, start_date)
+            return True
+
+    # The files are written under temporary names and moved into place only after all of them are complete,
+    # so an interrupted conversion never leaves partial files that look up to date.
+    cdf_filenames = [grid_cdf_filename, psd_cdf_filename, psdlmk_cdf_filename, out1d_cdf_filename]
+    tmp_filenames = [filename + '.tmp' for filename in cdf_filenames]
+    try:
+        time = _write_cdf_files(perp_grid_filename, psd_filename, out1d_filename, *tmp_filenames, out1d_dtype)
+    except BaseException:
+        for tmp_filename in tmp_filenames:
+            if os.path.isfile(tmp_filename):
+                os.remove(tmp_filename)
+        raise
+    for tmp_filename, filename in zip(tmp_filenames, cdf_filenames):
+        os.replace(tmp_filename, filename)
+
+    _create_timelist(file_dir, time, pattern_files, start_date)
 
     return True
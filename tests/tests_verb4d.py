@@ -476,6 +476,101 @@ class TestVerb02DatasetGeneration(TestCase):
         # Check results contains variable 'PSD_lea'
         self.assertIn('PSD_lea', results.keys(), 'Variable_Search does not return PSD_lea')
 
+    def test06_Skip_Fresh_Conversion(self):
+        reader = MW.Model_Reader(self.model)
+        reader(self.output_path, filetime=True)  # creates any preprocessed files
+        list_file = os.path.join(self.output_dir, self.model + '_list.txt')
+        times_file = os.path.join(self.output_dir, self.model + '_times.txt')
+        nc_files = [os.path.join(self.output_dir, f) for f in os.listdir(self.output_dir) if f.endswith('.nc')]
+        mtimes = [os.path.getmtime(f) for f in nc_files]
+
+        # Without the list files the dataset is converted again, but up-to-date .nc files must not be rewritten
+        os.remove(list_file)
+        os.remove(times_file)
+        reader(self.output_path, filetime=True)
+
+        self.assertTrue(os.path.isfile(list_file), 'List file is not created')
+        self.assertTrue(os.path.isfile(times_file), 'Times file is not created')
+        self.assertEqual([os.path.getmtime(f) for f in nc_files], mtimes, '.nc files were rewritten')
+
+        # A different out1d dtype requires the conversion even if the files are up to date
+        from netCDF4 import Dataset
+        from kamodo_ccmc.readers.verb3d_tocdf import convert_all
+        self.assertTrue(convert_all(self.output_path, out1d_dtype=np.float64))
+        with Dataset(os.path.join(self.output_dir, 'out1d.nc')) as ncfile:
+            self.assertEqual(ncfile.variables['Kp'].dtype, np.float64, 'out1d.nc was not converted to float64')
+
+    def test07_Interrupted_Conversion(self):
+        from kamodo_ccmc.readers import verb3d_tocdf
+        reader = MW.Model_Reader(self.model)
+        reader(self.output_path, filetime=True)  # creates any preprocessed files
+        nc_files = sorted(os.path.join(self.output_dir, f) for f in os.listdir(self.output_dir) if f.endswith('.nc'))
+        mtimes = [os.path.getmtime(f) for f in nc_files]
+
+        # Interrupt a forced conversion after two time steps
+        def interrupted_load_plt_iter(filename, load_plt_iter=verb3d_tocdf._load_plt_iter):
+            for t, zone in enumerate(load_plt_iter(filename)):
+                if t == 2:
+                    raise KeyboardInterrupt
+                yield zone
+
+        with patch.object(verb3d_tocdf, '_load_plt_iter', interrupted_load_plt_iter):
+            with self.assertRaises(KeyboardInterrupt):
+                verb3d_tocdf.convert_all(self.output_path, force=True)
+
+        # The previous conversion is untouched and no temporary files are left behind
+        self.assertEqual([os.path.getmtime(f) for f in nc_files], mtimes, '.nc files were modified')
+        self.assertFalse([f for f in os.listdir(self.output_dir) if f.endswith('.tmp')], 'Temporary files are left')
+        self.assertTrue(verb3d_tocdf.convert_all(self.output_path))
+
+
+class TestVerb02ConverterHelpers(TestCase):
+    """ This class tests the converter helpers that do not need the fake dataset. """
+
+    def test01_Read_Out1d_Irregular_Whitespace(self):
+        import tempfile
+        from kamodo_ccmc.readers.verb3d_tocdf import _read_out1d
+
+        with tempfile.TemporaryDirectory() as file_dir:
+            out1d_filename = os.path.join(file_dir, 'out1d.dat')
+            with open(out1d_filename, 'w') as f:
+                f.write('Variables = "time", "Kp"\nZONE T="1d-output"\n1.0 2.0\n3.0  -4.0\n 5.0\t6.0\n')
+            variables, df = _read_out1d(out1d_filename)
+
+        self.assertEqual(variables, ['time', 'Kp'])
+        np.testing.assert_array_equal(df.to_numpy(), [[1., 2.], [3., -4.], [5., 6.]])
+
+    def test02_Read_Out1d_Extra_Columns(self):
+        import tempfile
+        from kamodo_ccmc.readers.verb3d_tocdf import _read_out1d
+
+        with tempfile.TemporaryDirectory() as file_dir:
+            out1d_filename = os.path.join(file_dir, 'out1d.dat')
+            with open(out1d_filename, 'w') as f:
+                f.write('Variables = "time", "Kp"\nZONE T="1d-output"\n1.0  2.0 9.0\n3.0 4.0 5.0\n')
+            with self.assertRaises(ValueError):
+                _read_out1d(out1d_filename)
+
+    def test03_Cached_Start_Date(self):
+        import tempfile
+        from kamodo_ccmc.readers.verb3d_tocdf import get_start_date
+
+        with tempfile.TemporaryDirectory() as file_dir:
+            metadata_filename = os.path.join(file_dir, 'ror_metadata.json')
+            with open(metadata_filename, 'w') as f:
+                json.dump({'simulationStartTime': '2001-02-03T04:05:00'}, f)
+            self.assertEqual(get_start_date(file_dir), datetime(2001, 2, 3, 4, 5))
+            self.assertEqual(get_start_date(file_dir), datetime(2001, 2, 3, 4, 5))
+
+            # A changed metadata file must not return the cached date
+            with open(metadata_filename, 'w') as f:
+                json.dump({'simulationStartTime': '2011-12-13T14:15:00'}, f)
+            # Both writes may fall in the same mtime tick and have the same size, set a distinct mtime explicitly
+            stat = os.stat(metadata_filename)
+            os.utime(metadata_filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            self.assertEqual(get_start_date(file_dir), datetime(2011, 12, 13, 14, 15))
+
+
 # TODO: Determine datetime from class, not hardcoded
 class TestVerb03DatasetCheck(TestCase):
     """ This class is advanced test with fake dataset. """